@@ -1,13 +1,18 @@
 # api.py (top)
-import os, json, time, asyncio, inspect, logging, traceback
+import os, asyncio, hashlib, inspect, logging, tempfile, traceback
 from pathlib import Path
 from typing import Optional
 from fastapi import FastAPI, HTTPException, Request, Header, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from openai import AsyncOpenAI
+import httpx
+from pydantic import BaseModel, TypeAdapter
+import orjson
 
-from discovery import InterviewAnalyzer  # your class
+from discovery import InterviewAnalyzer, InterviewInsights  # your class
+from discovery._bundled_variants import SANITIZED, SENSITIVE
+from discovery.agents import _require_openai_key
 
 # 1) Create the app first
 app = FastAPI(title="Discovery AI Demo API")
@@ -22,41 +27,149 @@ app.add_middleware(
     ],
     allow_methods=["POST", "GET", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # 3) Globals & paths
-HERE = Path(__file__).parent
+# transcripts are bundled as constants (regenerate with scripts/bundle_variants.py)
 VARIANT_MAP = {
-    "sanitized": HERE / "data" / "interviews" / "sanitized.txt",
-    "sensitive": HERE / "data" / "interviews" / "sensitive.txt",
+    "sanitized": SANITIZED,
+    "sensitive": SENSITIVE,
 }
 CACHE_DIR = Path(os.getenv("CACHE_DIR", "/tmp/discovery_cache"))
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-def cache_path_for(variant: str) -> Path:
-    return CACHE_DIR / f"{variant}_cache.json"
+# Variant transcripts are static: fingerprint them once at startup.
+VARIANT_KEY: dict[str, str] = {}
+
+def cache_paths_for(variant: str) -> tuple[Path, Path]:
+    # (key sidecar, prebuilt cached response body)
+    return CACHE_DIR / f"{variant}.key", CACHE_DIR / f"{variant}.response.json"
+
+def render_demo_response(run_id: str, variant: str, cached: bool, steps: list, insights_json: bytes) -> bytes:
+    # splice already-serialized insights into the envelope instead of re-encoding them
+    head = orjson.dumps({"run_id": run_id, "variant": variant, "cached": cached, "steps": steps})
+    return head[:-1] + b',"insights":' + insights_json + b"}"
+
+# serializes straight to JSON bytes in pydantic-core, no dict intermediate
+INSIGHTS_ADAPTER = TypeAdapter(InterviewInsights)
+
+CACHED_STEPS = ["Loading cached insights", "Rendering…", "Done"]
+
+# variant -> (key sidecar mtime_ns, key, ETag, body or None); revalidated only when the sidecar changes.
+# The body is held in RAM when this process wrote it; otherwise the response file is streamed from disk.
+_CACHE: dict[str, tuple[int, str, str, Optional[bytes]]] = {}
+
+def cached_response_for(variant: str, key: str) -> Optional[Response]:
+    hit = _CACHE.get(variant)
+    if hit is None or hit[1] != key:
+        return None
+    mtime, _, etag, body = hit
+    key_file, response_file = cache_paths_for(variant)
+    try:
+        if os.stat(key_file).st_mtime_ns != mtime:
+            return None
+        if body is not None:
+            return Response(content=body, media_type="application/json", headers={"ETag": etag})
+        # FileResponse would only stat when sending, past run_demo's live fallback, so a
+        # missing body would be a 500; stat here and hand the result over instead.
+        stat = os.stat(response_file)
+    except FileNotFoundError:
+        return None
+    return FileResponse(response_file, media_type="application/json", headers={"ETag": etag}, stat_result=stat)
+
+def load_cached_key(variant: str, key: str) -> bool:
+    # only the tiny key sidecar ("<key> <etag>") is read; the response body is never pulled into Python here
+    key_file, _ = cache_paths_for(variant)
+    if not key_file.exists():
+        return False
+    mtime = key_file.stat().st_mtime_ns
+    stored_key, _, etag = key_file.read_bytes().partition(b" ")
+    if stored_key != key.encode("ascii") or not etag:
+        return False
+    _CACHE[variant] = (mtime, key, etag.decode("ascii"), None)
+    return True
+
+def replace_file(path: Path, data: bytes) -> None:
+    # Write beside the target and rename over it: a FileResponse still streaming the
+    # old file keeps its open handle to the old inode and never sees a partial write.
+    tmp = tempfile.NamedTemporaryFile(dir=CACHE_DIR, prefix=f".{path.name}.", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)  # e.g. disk full mid-write: don't leave the temp file behind
+        raise
+
+def write_cached_response(variant: str, key: str, run_id: str, insights_json: bytes) -> None:
+    # run_id, variant and steps are fixed per key, so the whole cached envelope is built once here
+    key_file, response_file = cache_paths_for(variant)
+    body = render_demo_response(run_id, variant, True, CACHED_STEPS, insights_json)
+    # A live run can rewrite the body under the same transcript key, so the ETag hashes the body
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    # key last so a half-written entry is never treated as a hit
+    replace_file(response_file, body)
+    replace_file(key_file, f"{key} {etag}".encode("ascii"))
+    _CACHE[variant] = (key_file.stat().st_mtime_ns, key, etag, body)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
 
 def cache_key_for(text: str, guidelines_key: str = "", variant: str = "") -> str:
-    import hashlib
-    raw = f"{variant}::{guidelines_key}::{text}"
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    # 8-byte BLAKE2b gives the same 16 hex chars as the old truncated SHA-256, faster.
+    # Fed piecewise: same digest as hashing f"{variant}::{guidelines_key}::{text}", no joined copy.
+    h = hashlib.blake2b(digest_size=8)
+    h.update(variant.encode("utf-8"))
+    h.update(b"::")
+    h.update(guidelines_key.encode("utf-8"))
+    h.update(b"::")
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
 
 def load_demo_text(variant: str) -> str:
     if variant not in VARIANT_MAP:
         raise HTTPException(400, f"Unknown variant '{variant}'. Allowed: {list(VARIANT_MAP)}")
-    p = VARIANT_MAP[variant]
-    if not p.exists():
-        raise HTTPException(500, f"Variant '{variant}' file missing at {p}. Commit & redeploy.")
-    return p.read_text(encoding="utf-8")
+    return VARIANT_MAP[variant]
 
 # 4) Initialize analyzer AFTER app exists
 analyzer: Optional[InterviewAnalyzer] = None
+openai_client: Optional[AsyncOpenAI] = None
+_ANALYZE_IS_ASYNC = False  # fixed once the analyzer exists; checked per request
 
 @app.on_event("startup")
 async def _init_analyzer():
-    global analyzer
+    global analyzer, openai_client, _ANALYZE_IS_ASYNC
+    for k, text in VARIANT_MAP.items():
+        VARIANT_KEY[k] = cache_key_for(text, "", k)
+
+    # fail with the clear "Set it in Railway" message before the SDK's generic one
+    _require_openai_key()
+
+    # one tuned HTTP/2 pool for the whole process, shared by the analyzer and debug routes
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    openai_client = AsyncOpenAI(http_client=http_client)  # picks up OPENAI_API_KEY
+
     # If you need to load guidelines, do it here and pass them in
-    analyzer = InterviewAnalyzer()
+    try:
+        analyzer = await InterviewAnalyzer.create(openai_client=openai_client)
+    except Exception:
+        await openai_client.close()  # don't leak the pool if startup fails
+        openai_client = None
+        raise
+    _ANALYZE_IS_ASYNC = inspect.iscoroutinefunction(analyzer.analyze)
+
+@app.on_event("shutdown")
+async def _close_clients():
+    if openai_client is not None:
+        await openai_client.close()
 
 # --- health/debug endpoints (optional) ---
 @app.get("/healthz")
@@ -65,13 +178,14 @@ def healthz():
 
 @app.get("/debug/variants")
 def debug_variants():
-    return {k: {"path": str(p), "exists": p.exists()} for k, p in VARIANT_MAP.items()}
+    return {k: {"bundled": True, "chars": len(text), "key": VARIANT_KEY.get(k)} for k, text in VARIANT_MAP.items()}
 
 @app.get("/debug/openai")
 async def debug_openai():
     try:
-        client = AsyncOpenAI()  # picks up OPENAI_API_KEY
-        await client.models.list()
+        if openai_client is None:
+            raise RuntimeError("OpenAI client not initialized")
+        await openai_client.models.list()
         return {"ok": True}
     except Exception as e:
         return JSONResponse({"ok": False, "err": str(e)}, status_code=500)
@@ -81,7 +195,7 @@ async def run_analysis(text: str):
     if analyzer is None:
         raise HTTPException(500, detail="analysis_error: analyzer not initialized")
     try:
-        if inspect.iscoroutinefunction(analyzer.analyze):
+        if _ANALYZE_IS_ASYNC:
             return await analyzer.analyze(text, audit=True, validate=True)
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: analyzer.analyze(text, audit=True, validate=True))
@@ -90,8 +204,46 @@ async def run_analysis(text: str):
         tb = "".join(traceback.format_exception_only(type(e), e)).strip()
         raise HTTPException(500, detail=f"analysis_error: {tb}")
 
+# cache key -> running analysis; concurrent live requests for the same transcript share one LLM call
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+async def analyze_and_cache(variant: str, key: str, run_id: str, text: str) -> bytes:
+    insights = await run_analysis(text)
+    if isinstance(insights, InterviewInsights):
+        insights_json = INSIGHTS_ADAPTER.dump_json(insights)
+    else:
+        insights_json = orjson.dumps(insights)
+
+    # cache (best effort)
+    try:
+        await asyncio.to_thread(write_cached_response, variant, key, run_id, insights_json)
+    except Exception:
+        logging.exception("Cache write failed (non-fatal).")
+    return insights_json
+
+def shared_analysis(variant: str, key: str, run_id: str, text: str) -> asyncio.Task:
+    # no await between lookup and insert, so this is atomic on the event loop
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(analyze_and_cache(variant, key, run_id, text))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return task
+
+# OpenAPI schema only: run_demo returns prebuilt bytes, so nothing is validated at runtime
+class DemoResponse(BaseModel):
+    run_id: str
+    variant: str
+    cached: bool
+    steps: list[str]
+    insights: InterviewInsights
+
 # 6) The demo endpoint (unchanged from earlier logic)
-@app.post("/demo/run")
+@app.post(
+    "/demo/run",
+    response_model=None,
+    responses={200: {"model": DemoResponse}},
+)
 async def run_demo(
     request: Request,
     mode: str = Query("auto", enum=["auto", "cached", "live"]),
@@ -103,44 +255,27 @@ async def run_demo(
         raise HTTPException(400, "Missing session header 'x-demo-session'.")
 
     text = load_demo_text(variant)
-    key = cache_key_for(text, "", variant)
+    key = VARIANT_KEY[variant]
     run_id = f"demo-{variant}-{key}"
-    cache_file = cache_path_for(variant)
 
-    # try cache
-    if mode in ("auto", "cached") and cache_file.exists():
+    # try cache: a known key costs one stat; revalidating the sidecar runs off the event loop
+    if mode in ("auto", "cached"):
         try:
-            data = json.loads(cache_file.read_text())
-            if data.get("key") == key:
-                return {
-                    "run_id": run_id,
-                    "variant": variant,
-                    "cached": True,
-                    "steps": ["Loading cached insights", "Rendering…", "Done"],
-                    "insights": data["insights"],
-                }
+            cached = cached_response_for(variant, key)
+            if cached is None and await asyncio.to_thread(load_cached_key, variant, key):
+                cached = cached_response_for(variant, key)
+            if cached is not None:
+                etag = cached.headers["etag"]
+                if etag_matches(request.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers={"ETag": etag})
+                return cached
         except Exception:
             logging.exception("Cache read failed; running live.")
 
     # live
     steps = ["Reading transcript", "Extracting insights", "Validating schema", "Preparing export"]
-    insights = await run_analysis(text)
-
-    # cache (best effort)
-    try:
-        cache_file.write_text(json.dumps({
-            "key": key,
-            "variant": variant,
-            "insights": insights.model_dump() if hasattr(insights, "model_dump") else insights,
-            "cached_at": time.time(),
-        }), encoding="utf-8")
-    except Exception:
-        logging.exception("Cache write failed (non-fatal).")
+    # shield: a disconnecting client must not cancel the run other callers are awaiting
+    insights_json = await asyncio.shield(shared_analysis(variant, key, run_id, text))
 
-    return {
-        "run_id": run_id,
-        "variant": variant,
-        "cached": False,
-        "steps": steps + ["Done"],
-        "insights": insights.model_dump() if hasattr(insights, "model_dump") else insights,
-    }
+    body = render_demo_response(run_id, variant, False, steps + ["Done"], insights_json)
+    return Response(content=body, media_type="application/json")
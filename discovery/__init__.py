@@ -2,6 +2,8 @@
 Discovery AI - Automated genAI interview analysis with privacy enforcement.
 """
 
+import logging
+
 from .models import (
     InterviewInsights,
     PainPoint,
@@ -12,13 +14,16 @@ from .models import (
     MentalModel
 )
 
-from .config import load_guidelines, build_system_prompt
-from .privacy import enforce_pii_removal, validate_no_pii, audit_pii_in_transcript
+from .config import load_guidelines, load_guidelines_async, build_system_prompt
+from .privacy import PrivacyEngine, enforce_pii_removal, validate_no_pii, audit_pii_in_transcript
 from .agents import create_insight_agent
 from .analyzer import InterviewAnalyzer
 
 __version__ = "0.1.0"
 
+# Library logging stays silent unless the application configures handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __all__ = [
     # Main interface
     'InterviewAnalyzer',
@@ -34,9 +39,11 @@ __all__ = [
     
     # Config
     'load_guidelines',
+    'load_guidelines_async',
     'build_system_prompt',
     
     # Privacy
+    'PrivacyEngine',
     'enforce_pii_removal',
     'validate_no_pii',
     'audit_pii_in_transcript',
@@ -0,0 +1,93 @@
+"""
+Demo interview transcripts bundled as constants.
+
+Generated by scripts/bundle_variants.py from data/interviews/*.txt - do not edit.
+"""
+
+SANITIZED = (
+    '\ufeffInterviewer: Thanks for making the time today. I know you’ve been working with our API pretty regularly. Before I ask anything specific, could you just tell me about what you’ve been building recently that relied on it?\n'
+    'Interviewee: Sure. Right now I’m working on a feature that generates custom reports for clients. We’re pulling transaction data through your API and then filtering it down to what’s relevant for them.\n'
+    'Interviewer: And when you started on that, how did you approach the integration?\n'
+    'Interviewee: First step was the docs. I usually open them side by side with my IDE. I try a couple of sample requests, see what comes back, and then figure out how to fit it into our pipeline.\n'
+    'Interviewer: How smooth was that for you this time around?\n'
+    'Interviewee: The basic call worked. But once I looked closer, there were way more fields than I expected. Some are self-explanatory, some are not. I ended up dumping the response into a JSON viewer and going field by field.\n'
+    'Interviewer: How did you decide which fields to actually use?\n'
+    'Interviewee: Honestly, guesswork. Trial and error. Sometimes the name matches what I need, sometimes not. If I can’t figure it out, I search through our old repos to see how we used it before.\n'
+    'Interviewer: That sounds a bit like detective work. Does that happen often?\n'
+    'Interviewee: Pretty often, yeah. It’s kind of routine now.\n'
+    'Interviewer: And what’s it like when you run into that situation?\n'
+    'Interviewee: It slows me down. I know I’ll get it eventually, but it’s wasted cycles.\n'
+    'Interviewer: Have you found ways to make that process quicker for yourself?\n'
+    'Interviewee: Sometimes I write little scripts to experiment. Other times I ping your team in Slack. But then I’m waiting for a reply, so it depends.\n'
+    'Interviewer: Got it. Switching gears a little — can you think of a time where using the API felt more frustrating than usual?\n'
+    'Interviewee: Yeah, pagination last week. I kept getting “invalid cursor.” I couldn’t tell if I formatted it wrong or if it expired or what. The error message didn’t explain.\n'
+    'Interviewer: What did you end up doing?\n'
+    'Interviewee: Tried a bunch of variations until it stopped complaining. Took me a while.\n'
+    'Interviewer: If the message had been clearer, how would that have changed your approach?\n'
+    'Interviewee: I’d have fixed it in five minutes instead of an hour.\n'
+    'Interviewer: Makes sense. On the flip side, is there a time where the API surprised you in a good way?\n'
+    'Interviewee: Yeah, performance. We were worried about high-volume queries, but it held up really well under load. That was a pleasant surprise.\n'
+    'Interviewer: Interesting. Do you remember how that affected your work at the time?\n'
+    'Interviewee: Honestly, it meant we didn’t have to build extra caching layers. We could trust it to respond fast enough.\n'
+    'Interviewer: If you imagine the “perfect” version of this API, what would be different from today?\n'
+    'Interviewee: First thing: consistency. Right now, some endpoints return arrays, others wrap everything in an object with metadata. It’s small, but it adds friction. If they all looked the same, onboarding new devs would be way smoother.\n'
+    'Interviewer: And when onboarding is smoother, what does that do for you and your team?\n'
+    'Interviewee: Less time teaching quirks. New people can contribute faster. I don’t have to explain the “gotchas” every time.\n'
+    'Interviewer: Are there things outside of the request/response flow that you’d like but don’t currently have?\n'
+    'Interviewee: Definitely. Observability. Right now, if something goes wrong, I only notice when logs blow up or when a customer reports it. I’d love to see metrics: latency, error rates, success ratios.\n'
+    'Interviewer: And what difference would that make in your day-to-day?\n'
+    'Interviewee: I’d catch problems earlier. Be proactive instead of reactive.\n'
+    'Interviewer: How do you handle testing right now?\n'
+    'Interviewee: That’s tricky. There isn’t a real sandbox. So we either mock responses, which doesn’t feel realistic, or we test against production and hope for the best.\n'
+    'Interviewer: Has that ever backfired?\n'
+    'Interviewee: Yeah, once we polluted real data by mistake. Had to clean it up. Stressful.\n'
+    'Interviewer: If you had a sandbox tomorrow, how would you actually use it?\n'
+    'Interviewee: I’d spin up scenarios, try edge cases, test bulk operations. Right now I avoid those tests because they’re too risky in prod.\n'
+    'Interviewer: Bulk operations — tell me more about that.\n'
+    'Interviewee: Right now I have to loop through records one by one. If there was a bulk endpoint, I could just send a batch request. That’d cut down code complexity and execution time.\n'
+    'Interviewer: Got it. Looking at the bigger picture: when you think about this API, what role does it play in your work?\n'
+    'Interviewee: It’s like plumbing. It delivers the data I need. I don’t want to think about it. I just want it to be invisible and reliable.\n'
+    'Interviewer: And when it’s not invisible?\n'
+    'Interviewee: Then I’m an “API detective” instead of a product developer.\n'
+    'Interviewer: That’s a nice way of putting it. Anything I haven’t asked that you think I should know?\n'
+    'Interviewee: No, I think that’s it. Just: it works, it’s stable, but the paper cuts add up — errors, inconsistencies, lack of sandbox, no metrics.\n'
+    'Interviewer: Super helpful. Thanks for being so candid.'
+)
+
+SENSITIVE = (
+    '\ufeffInterviewer: Thanks for joining today. As before, I just want to hear how you’ve been working with our API, what’s been smooth, and where things get bumpy. Let’s start with your most recent project — what were you building?\n'
+    'Interviewee: Sure. I was working on a client onboarding flow for one of our enterprise accounts — you probably know them, Müller Pharma GmbH. They wanted automated pulls of employee records, so we integrated your /users endpoint.\n'
+    'Interviewer: And what did that integration process look like for you?\n'
+    'Interviewee: Well, I had to map their HR system IDs to ours. For example, I was matching their user lisa.schneider@muellerpharma.de with our internal UID. I tested by sending requests with her email in the payload.\n'
+    'Interviewer: And how did that go?\n'
+    'Interviewee: Technically it worked. But again, the docs didn’t say clearly which field was required. I first sent just the email, then I added employeeNumber=87233119, then eventually both. Took me three tries.\n'
+    'Interviewer: What’s that like when you hit those bumps?\n'
+    'Interviewee: Frustrating. Especially because we’re under pressure to comply with GDPR. We’re moving sensitive stuff — emails, phone numbers, even IBANs sometimes — through your API. If I don’t know exactly how to format it, I’m stuck.\n'
+    'Interviewer: What’s your workaround when the docs don’t give you enough?\n'
+    'Interviewee: Honestly? I just try live calls. For example, I used my own company email marco.fischer@ourbankingapp.com as a test account, just to see what fields would accept. Sometimes I paste in test tokens too, like sk_test_4eC39HqLyjWDarjtT1zdp7dc.\n'
+    'Interviewer: And does that feel safe to you?\n'
+    'Interviewee: Not really, no. I know I shouldn’t be sending real emails or tokens into logs, but without a sandbox I don’t have a choice.\n'
+    'Interviewer: So no sandbox has a real impact then?\n'
+    'Interviewee: Huge. I can’t use fake data realistically. I end up using actual customers — like jens.bauer@kundenportal.de or even their phone numbers like +49 172 44556677. And if I screw up, that ends up in production logs.\n'
+    'Interviewer: That sounds risky. Has it ever caused bigger problems?\n'
+    'Interviewee: Yeah, once. I accidentally triggered a password reset email for a test account belonging to katrin.meier@biginsurance.com. She actually called us, asking why she got the email. Super embarrassing.\n'
+    'Interviewer: Wow. And how did you handle that?\n'
+    'Interviewee: We apologized, explained it was an internal test. But it’s exactly why we need a non-production environment.\n'
+    'Interviewer: Besides the sandbox issue, what else slows you down?\n'
+    'Interviewee: Error messages. For example, I sent a batch request with ten customer records. One had a malformed IBAN — DE89 3704 0044 0532 0130 00 without spaces — and the whole batch failed. The response just said “invalid input.” Which one? No idea.\n'
+    'Interviewer: If that had been clearer?\n'
+    'Interviewee: I’d have fixed that one line instead of combing through all ten.\n'
+    'Interviewer: Makes sense. How do you usually debug when that happens?\n'
+    'Interviewee: I log the payload. Which means sometimes I’m logging stuff like names, emails, even credit card BIN ranges. I know it’s not GDPR-compliant, but I don’t see another way.\n'
+    'Interviewer: Understood. Switching gears — can you tell me about a time the API really worked well?\n'
+    'Interviewee: Performance. We were loading 20,000 customer profiles — with emails like anna.keller@supermarkt24.de and thomas.schulz@travelio.com — and the response time stayed under 500ms. That was impressive.\n'
+    'Interviewer: And a time when it didn’t?\n'
+    'Interviewee: When we had to delete accounts. The DELETE /users endpoint requires the userId and email. I accidentally sent a production ID — user-119992 linked to michael.kruger@autohaus.de — in staging, and it actually removed his account in prod.\n'
+    'Interviewer: Ouch. What would have prevented that?\n'
+    'Interviewee: A clear separation between environments. And safer defaults.\n'
+    'Interviewer: If you imagine the API being “perfect,” what would that look like?\n'
+    'Interviewee: Consistent responses, detailed error messages, and definitely a sandbox with realistic fake data. Plus, tools for observing usage — like, I’d love to see when a request with julia.weber@finanzplus.de fails and why, without having to grep through logs.\n'
+    'Interviewer: Last question — when you think about the role this API plays in your work, how do you see it?\n'
+    'Interviewee: It’s the backbone. It’s how I move sensitive customer information — emails, phone numbers, account IDs — between systems. So if it’s clunky, it’s not just annoying, it’s dangerous.\n'
+    'Interviewer: That’s a strong statement. Thanks for being so open. This was very valuable.'
+)
@@ -2,8 +2,11 @@
 Agent creation and management for analysis.
 """
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from openai import AsyncOpenAI
 from pydantic_ai import Agent
+from pydantic_ai.models import infer_model
+from pydantic_ai.providers.openai import OpenAIProvider
 
 
 def _require_openai_key() -> str:
@@ -20,12 +23,20 @@ def create_insight_agent(
     guidelines: Dict[str, Any],
     model: str = "openai:gpt-4o-mini",
     temperature: float = 0.3,
+    openai_client: Optional[AsyncOpenAI] = None,
 ) -> Agent:
     # Ensure the key exists before we let pydantic-ai build the provider.
     _require_openai_key()
 
+    # Fixed per guidelines and sent ahead of the transcript (the only per-call input),
+    # so OpenAI's automatic prefix caching covers it. Keep anything dynamic out of it.
     system_prompt = build_system_prompt(guidelines)
 
+    # Reuse the caller's client (and its connection pool) instead of a fresh one per agent.
+    # infer_model resolves the string exactly as Agent would, so both paths use the same model class.
+    if openai_client is not None:
+        model = infer_model(model, provider_factory=lambda _: OpenAIProvider(openai_client=openai_client))
+
     agent = Agent(
         model=model,                             # keep "openai:gpt-4o-mini"
         output_type=InterviewInsights,
@@ -2,30 +2,56 @@
 Main analysis orchestration for interview insights extraction.
 """
 
+import asyncio
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from .config import load_guidelines
+from openai import AsyncOpenAI
+
+from .config import load_guidelines, load_guidelines_async
 from .agents import create_insight_agent
-from .privacy import enforce_pii_removal, validate_no_pii, audit_pii_in_transcript
+from .privacy import PrivacyEngine, enforce_pii_removal, validate_no_pii, audit_pii_in_transcript
 from .models import InterviewInsights
 
-from .transcription import transcribe_audio
+from .transcription import transcribe_audio_async
+
+
+logger = logging.getLogger(__name__)
 
 
 class InterviewAnalyzer:
-    def __init__(self, config_path: str = "config/research_guidelines.yaml"):
-        self.guidelines = load_guidelines(config_path)
-        self.agent = create_insight_agent(self.guidelines)
+    def __init__(
+        self,
+        config_path: str = "config/research_guidelines.yaml",
+        openai_client: Optional[AsyncOpenAI] = None,
+        guidelines: Optional[Dict[str, Any]] = None
+    ):
+        self.guidelines = guidelines if guidelines is not None else load_guidelines(config_path)
+        self.openai_client = openai_client
+        self.agent = create_insight_agent(self.guidelines, openai_client=openai_client)
         self.privacy_rules = self.guidelines['privacy_enforcement']
+        self.privacy = PrivacyEngine(self.privacy_rules)
+    
+    @classmethod
+    async def create(
+        cls,
+        config_path: str = "config/research_guidelines.yaml",
+        openai_client: Optional[AsyncOpenAI] = None
+    ) -> "InterviewAnalyzer":
+        # Loads the guidelines without blocking the event loop
+        guidelines = await load_guidelines_async(config_path)
+        return cls(config_path, openai_client=openai_client, guidelines=guidelines)
     
     def load_transcript(self, filepath: str) -> str:
         path = Path(filepath)
         if not path.exists():
             raise FileNotFoundError(f"Transcript not found: {filepath}")
         
-        with open(path, 'r') as f:
-            return f.read()
+        return path.read_text(encoding="utf-8")
+    
+    async def load_transcript_async(self, filepath: str) -> str:
+        return await asyncio.to_thread(self.load_transcript, filepath)
     
     async def analyze(
         self,
@@ -34,12 +60,19 @@ class InterviewAnalyzer:
         validate: bool = True
     ) -> InterviewInsights:
         # Optional: Audit PII in original transcript
+        findings = None
         if audit:
-            audit_pii_in_transcript(transcript, self.privacy_rules)
+            findings = audit_pii_in_transcript(transcript, self.privacy)
+            logger.info("PII audit: %s", findings)
         
-        # Remove PII before sending to LLM
-        clean_transcript = enforce_pii_removal(transcript, self.privacy_rules)
-        print("\nPII removed from transcript")
+        # Remove PII before sending to LLM. The audit scans with the same pattern
+        # the cleanup uses, so zero findings means cleanup would be a no-op.
+        if findings is not None and not any(findings.values()):
+            clean_transcript = transcript
+            logger.info("No PII found in transcript")
+        else:
+            clean_transcript = enforce_pii_removal(transcript, self.privacy)
+            logger.info("PII removed from transcript")
         
         # Extract insights
         result = await self.agent.run(clean_transcript)
@@ -47,11 +80,28 @@ class InterviewAnalyzer:
         
         # Optional: Validate no PII in output
         if validate:
-            validate_no_pii(insights, self.privacy_rules)
-            print("Output validated - no PII detected")
+            validate_no_pii(insights, self.privacy)
+            logger.info("Output validated - no PII detected")
         
         return insights
     
+    async def analyze_many(
+        self,
+        transcripts: List[str],
+        *,
+        concurrency: int = 8,
+        audit: bool = False,
+        validate: bool = True
+    ) -> List[InterviewInsights]:
+        # Fan out LLM calls, capped to respect provider rate limits; results keep input order
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def one(transcript: str) -> InterviewInsights:
+            async with sem:
+                return await self.analyze(transcript, audit=audit, validate=validate)
+        
+        return await asyncio.gather(*(one(t) for t in transcripts))
+    
     async def analyze_file(
         self,
         filepath: str,
@@ -59,7 +109,7 @@ class InterviewAnalyzer:
         validate: bool = True
     ) -> InterviewInsights:
 
-        transcript = self.load_transcript(filepath)
+        transcript = await self.load_transcript_async(filepath)
         return await self.analyze(transcript, audit=audit, validate=validate)
 
 
@@ -74,13 +124,12 @@ class InterviewAnalyzer:
     ) -> InterviewInsights:
 
         # Transcribe audio
-        transcript = transcribe_audio(audio_path, language=language)
+        transcript = await transcribe_audio_async(audio_path, language=language, client=self.openai_client)
         
         # Optionally save transcript
         if save_transcript:
-            with open(save_transcript, 'w') as f:
-                f.write(transcript)
-            print(f"Transcript saved to: {save_transcript}")
+            await asyncio.to_thread(Path(save_transcript).write_text, transcript, encoding="utf-8")
+            logger.info("Transcript saved to: %s", save_transcript)
         
         # Analyze transcript
         return await self.analyze(transcript, audit=audit, validate=validate)
\ No newline at end of file
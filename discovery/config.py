@@ -2,10 +2,24 @@
 Configuration management for research guidelines.
 """
 
+import asyncio
+import copy
+import functools
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeLoader as _Loader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_guidelines(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is only part of the cache key, so edits to the file are picked up
+    return yaml.load(path.read_bytes(), Loader=_Loader)
+
 
 def load_guidelines(config_path: str = "config/research_guidelines.yaml") -> Dict[str, Any]:
     path = Path(config_path)
@@ -13,10 +27,13 @@ def load_guidelines(config_path: str = "config/research_guidelines.yaml") -> Dic
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(path, 'r') as f:
-        guidelines = yaml.safe_load(f)
-    
-    return guidelines
+    # Parse each file once per process; hand out copies so callers can't mutate the cache
+    path = path.resolve()
+    return copy.deepcopy(_parse_guidelines(path, path.stat().st_mtime_ns))
+
+
+async def load_guidelines_async(config_path: str = "config/research_guidelines.yaml") -> Dict[str, Any]:
+    return await asyncio.to_thread(load_guidelines, config_path)
 
 
 def build_system_prompt(guidelines: Dict[str, Any]) -> str:
@@ -2,12 +2,14 @@
 Pydantic data models for interview insights extraction.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional
 
 
 class PainPoint(BaseModel):
     """A problem the user is experiencing"""
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(description="What's not working for the user")
     impact: str = Field(description="Time lost, extra work, costs, uncertainty")
     quote: str = Field(description="User's exact words")
@@ -15,6 +17,8 @@ class PainPoint(BaseModel):
 
 class JobToBeDone(BaseModel):
     """What the user is trying to accomplish"""
+    model_config = ConfigDict(frozen=True)
+
     functional_job: str = Field(description="What task are they trying to complete?")
     emotional_job: str = Field(description="How do they want to feel?")
     context: str = Field(description="When/where does this happen?")
@@ -23,6 +27,8 @@ class JobToBeDone(BaseModel):
 
 class Workaround(BaseModel):
     """Manual solution the user created"""
+    model_config = ConfigDict(frozen=True)
+
     what_they_do: str = Field(description="The workaround they've created")
     why_needed: str = Field(description="What problem does this solve?")
     cost: str = Field(description="Time/effort this workaround takes")
@@ -31,6 +37,8 @@ class Workaround(BaseModel):
 
 class DesiredOutcome(BaseModel):
     """What success looks like to the user"""
+    model_config = ConfigDict(frozen=True)
+
     outcome: str = Field(description="What do they really want?")
     current_gap: str = Field(description="Why can't they achieve this now?")
     quote: str
@@ -38,6 +46,8 @@ class DesiredOutcome(BaseModel):
 
 class BehavioralSignal(BaseModel):
     """Implicit pattern revealing underlying needs"""
+    model_config = ConfigDict(frozen=True)
+
     observation: str = Field(description="What did they say/do that was revealing?")
     what_it_reveals: str = Field(description="The underlying need or belief")
     quote: str
@@ -45,6 +55,8 @@ class BehavioralSignal(BaseModel):
 
 class MentalModel(BaseModel):
     """How the user conceptualizes their work"""
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(description="How they think about or categorize something")
     metaphor_or_analogy: Optional[str] = Field(default=None)
     mismatch_with_reality: Optional[str] = Field(default=None)
@@ -53,9 +65,34 @@ class MentalModel(BaseModel):
 
 class InterviewInsights(BaseModel):
     """All insights extracted from a single interview"""
+    # Frozen blocks attribute assignment only: the lists stay mutable and make
+    # instances unhashable, so don't use them as dict keys or set members.
+    model_config = ConfigDict(frozen=True)
+
     pain_points: List[PainPoint] = []
     jobs_to_be_done: List[JobToBeDone] = []
     workarounds: List[Workaround] = []
     desired_outcomes: List[DesiredOutcome] = []
     behavioral_signals: List[BehavioralSignal] = []
-    mental_models: List[MentalModel] = []
\ No newline at end of file
+    mental_models: List[MentalModel] = []
+
+    def to_columns(self) -> Dict[str, Dict[str, List[Optional[str]]]]:
+        """Opt-in analytics view (category -> field -> values); row-wise code should iterate items"""
+        columns = {}
+        for category, item_type in _ITEM_TYPES.items():
+            items = getattr(self, category)
+            columns[category] = {
+                field: [getattr(item, field) for item in items]
+                for field in item_type.model_fields
+            }
+        return columns
+
+
+_ITEM_TYPES = {
+    'pain_points': PainPoint,
+    'jobs_to_be_done': JobToBeDone,
+    'workarounds': Workaround,
+    'desired_outcomes': DesiredOutcome,
+    'behavioral_signals': BehavioralSignal,
+    'mental_models': MentalModel,
+}
\ No newline at end of file
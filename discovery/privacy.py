@@ -2,68 +2,202 @@
 Privacy and PII handling.
 """
 
+import logging
 import re
-from typing import Dict, Any, List
+from collections import Counter
+from functools import partial
+from operator import attrgetter
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Union
+
+try:
+    import re2  # optional: google-re2, linear-time DFA matching
+except ImportError:
+    re2 = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Structured patterns share one leftmost-match pass: the match that starts first wins,
+# earlier entries break ties at the same position, and redacted text is not rescanned.
+# This is not the old one-pass-per-pattern result where matches overlap: "EMP-1234567"
+# is "[ID]" here but was "EMP-[PHONE]", and a fragment the old later passes would have
+# caught can survive ("…@DE89.desk_live_2" keeps "_live_2" after its "[EMAIL]").
+STRUCTURED_ORDER = ('api_token', 'iban', 'email', 'phone', 'employee_id')
+# `names` runs as its own final pass over the structured result. It is greedy and
+# can start before a structured match ("Kontakt Anna@firma.de") and swallow its
+# beginning, so it must not compete with the structured patterns in one alternation.
+NAMES = 'names'
+REDACTION_ORDER = STRUCTURED_ORDER + (NAMES,)
+CASE_INSENSITIVE = frozenset({'email', 'employee_id'})
+
+VALIDATION_ISSUES = {
+    'email': "EMAIL detected in output",
+    'phone': "PHONE NUMBER detected in output",
+    'employee_id': "EMPLOYEE ID detected in output",
+}
+
+AUDIT_LABELS = {
+    'email': 'Emails',
+    'phone': 'Phone Numbers',
+    'employee_id': 'Employee IDs',
+    'names': 'Names',
+    'iban': 'IBANs',
+    'api_token': 'API Tokens',
+}
+
+
+def _first_named_group(match) -> str:
+    # RE2 may report an inner unnamed group as lastgroup, so look the name up directly
+    return next(name for name, value in match.groupdict().items() if value is not None)
+
+
+def _combine(patterns: Dict[str, str], names, case_insensitive=frozenset()):
+    parts = []
+    for name in names:
+        pattern = patterns[name]
+        if name in case_insensitive:
+            pattern = f"(?i:{pattern})"
+        parts.append(f"(?P<{name}>{pattern})")
+    combined = "|".join(parts)
+
+    # Returns (compiled pattern, match -> group name)
+    compiled = _compile(combined)
+    if isinstance(compiled, re.Pattern):
+        return compiled, attrgetter('lastgroup')
+    return compiled, _first_named_group
+
+
+# RE2's \d and \s are ASCII-only while stdlib re matches any Unicode digit and
+# whitespace, so patterns are rewritten with explicit classes before RE2 sees them.
+# Every Unicode whitespace character lies in the BMP.
+_RE2_SPACE = "".join(
+    f"\\x{{{code:x}}}" for code in range(0x10000) if chr(code).isspace()
+) if re2 is not None else ""
+_RE2_ESCAPES = {'d': r"\p{Nd}", 'D': r"\P{Nd}", 's': f"[{_RE2_SPACE}]", 'S': f"[^{_RE2_SPACE}]"}
+_RE2_CLASS_ESCAPES = {'d': r"\p{Nd}", 's': _RE2_SPACE}
+# Escapes and anchors whose meaning differs between the engines: leave those patterns to re
+_RE2_UNSAFE = set("wWbBAZ")
+
+
+def _re2_pattern(pattern: str) -> Optional[str]:
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            if escape in _RE2_UNSAFE:
+                return None
+            table = _RE2_CLASS_ESCAPES if in_class else _RE2_ESCAPES
+            if escape in table:
+                out.append(table[escape])
+            elif in_class and escape in "DS":
+                return None  # a negated shorthand cannot be spelled inside a class
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A ']' straight after '[' or '[^' is a literal, not the end of the class
+            start = i + 2 if pattern.startswith("^", i + 1) else i + 1
+            if pattern.startswith("]", start):
+                out.append(pattern[i:start + 1])
+                i = start + 1
+                continue
+        elif char == "$":
+            return None  # re's $ also matches before a trailing newline
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _compile(pattern: str):
+    if re2 is not None:
+        translated = _re2_pattern(pattern)
+        if translated is not None:
+            try:
+                return re2.compile(translated)
+            except re2.error:
+                pass  # pattern uses a feature RE2 lacks (e.g. backreferences); use stdlib re
+    return re.compile(pattern)
+
+
+class PrivacyEngine:
+    """PII patterns compiled once into single-pass alternations"""
+
+    def __init__(self, privacy_rules: Dict[str, Any]):
+        pii = privacy_rules['pii_removal']
+        patterns = pii['patterns']
+
+        self.enabled = pii['enabled']
+        self._replacements = {name: pii['replacement_tokens'][name] for name in REDACTION_ORDER}
+        self._structured, self._group_of = _combine(patterns, STRUCTURED_ORDER, CASE_INSENSITIVE)
+        self._names = _compile(patterns[NAMES])
+        self._validation, self._validation_group_of = _combine(patterns, VALIDATION_ISSUES)
+
+        # clean(text) is specialized once for this config: no enabled check or
+        # attribute lookups per call, just two bound sub() calls and closures over the tokens.
+        if self.enabled:
+            replacements, group_of = self._replacements, self._group_of
+            names_token = replacements[NAMES]
+            structured_sub = partial(self._structured.sub, lambda match: replacements[group_of(match)])
+            names_sub = partial(self._names.sub, lambda match: names_token)
+            self.clean: Callable[[str], str] = lambda text: names_sub(structured_sub(text))
+        else:
+            self.clean = lambda text: text
+
+    def find_issues(self, texts: Iterable[str]) -> List[str]:
+        found = set()
+        for text in texts:
+            for match in self._validation.finditer(text):
+                found.add(self._validation_group_of(match))
+                if len(found) == len(VALIDATION_ISSUES):
+                    return list(VALIDATION_ISSUES.values())
+        return [issue for name, issue in VALIDATION_ISSUES.items() if name in found]
+
+    def count(self, text: str) -> Dict[str, int]:
+        # Counts what clean() redacts, so structured categories are exclusive: a span is
+        # counted only under the pattern that wins it. map + attrgetter keeps the loop in C.
+        counts = Counter(map(self._group_of, self._structured.finditer(text)))
+        counts[NAMES] = sum(1 for _ in self._names.finditer(text))
+        return {label: counts[name] for name, label in AUDIT_LABELS.items()}
+
+
+def _engine(privacy_rules: Union[PrivacyEngine, Dict[str, Any]]) -> PrivacyEngine:
+    if isinstance(privacy_rules, PrivacyEngine):
+        return privacy_rules
+    return PrivacyEngine(privacy_rules)
 
 
 def enforce_pii_removal(text, privacy_rules) -> str:
-    if not privacy_rules['pii_removal']['enabled']:
-        return text
-    
-    patterns = privacy_rules['pii_removal']['patterns']
-    replacements = privacy_rules['pii_removal']['replacement_tokens']
-    
-    # Apply replacements
-    text = re.sub(patterns['api_token'], replacements['api_token'], text)
-    text = re.sub(patterns['iban'], replacements['iban'], text)
-    text = re.sub(patterns['email'], replacements['email'], text, flags=re.IGNORECASE)
-    text = re.sub(patterns['phone'], replacements['phone'], text)
-    text = re.sub(patterns['employee_id'], replacements['employee_id'], text, flags=re.IGNORECASE)
-    text = re.sub(patterns['names'], replacements['names'], text)
-    
-    return text
+    return _engine(privacy_rules).clean(text)
+
+
+def _iter_text(insights) -> Iterator[str]:
+    # Every string field of every insight, without serializing the model
+    for _, section in insights:
+        for item in section:
+            for _, value in item:
+                if isinstance(value, str):
+                    yield value
 
 
 def validate_no_pii(insights, privacy_rules) -> bool:
-    all_text = insights.model_dump_json()
-    patterns = privacy_rules['pii_removal']['patterns']
-    
-    issues = []
-    
-    if re.search(patterns['email'], all_text):
-        issues.append("EMAIL detected in output")
-    
-    if re.search(patterns['phone'], all_text):
-        issues.append("PHONE NUMBER detected in output")
-    
-    if re.search(patterns['employee_id'], all_text):
-        issues.append("EMPLOYEE ID detected in output")
-    
+    issues = _engine(privacy_rules).find_issues(_iter_text(insights))
+
     if issues:
         for issue in issues:
-            print(f"WARNING: {issue}")
+            logger.warning(issue)
         raise ValueError("PII VALIDATION FAILED - output blocked for compliance")
-    
+
     return True
 
 
 def audit_pii_in_transcript(text, privacy_rules) -> Dict[str, int]:
-    patterns = privacy_rules['pii_removal']['patterns']
-    
-    findings = {
-        'Emails': len(re.findall(patterns['email'], text)),
-        'Phone Numbers': len(re.findall(patterns['phone'], text)),
-        'Employee IDs': len(re.findall(patterns['employee_id'], text)),
-        'Names': len(re.findall(patterns['names'], text)),
-        'IBANs': len(re.findall(patterns['iban'], text)),
-        'API Tokens': len(re.findall(patterns['api_token'], text))
-    }
-    
-    print("\nPII Detection Summary:")
-    print("-" * 30)
-    for pii_type, count in findings.items():
-        print(f"{pii_type:20} {count:>5}")
-    print("-" * 30)
-    print(f"{'TOTAL':20} {sum(findings.values()):>5}")
-    
-    return findings
\ No newline at end of file
+    return _engine(privacy_rules).count(text)
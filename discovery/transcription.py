@@ -2,31 +2,53 @@
 Audio transcription using OpenAI Whisper API.
 """
 
+import asyncio
+import logging
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import openai
+from openai import AsyncOpenAI
+
+
+# Whisper API accepts various formats
+SUPPORTED_FORMATS = {'.m4a', '.mp3', '.wav', '.mp4', '.mpeg', '.mpga', '.webm'}
+
+# Whisper rejects uploads over 25 MB; larger files are split into segments first
+MAX_UPLOAD_BYTES = 24 * 1024 * 1024
+SEGMENT_SECONDS = 600
+# Segments are re-encoded rather than stream-copied: a copied segment keeps the
+# source bitrate (10 minutes of WAV is ~100 MB), a 64 kbit/s mono MP3 stays ~5 MB.
+SEGMENT_ENCODING = ("-vn", "-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "64k")
+
+logger = logging.getLogger(__name__)
+
+
+def _check_audio_file(audio_path: str) -> Path:
+    path = Path(audio_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    if path.suffix.lower() not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported format: {path.suffix}. Supported: {SUPPORTED_FORMATS}")
+
+    return path
 
 
 def transcribe_audio(
     audio_path: str,
     language: Optional[str] = None,
     prompt: Optional[str] = None
-    
+
 ) -> str:
-    path = Path(audio_path)
-    
-    if not path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
-    
-    # Whisper API accepts various formats
-    supported_formats = {'.m4a', '.mp3', '.wav', '.mp4', '.mpeg', '.mpga', '.webm'}
-    if path.suffix.lower() not in supported_formats:
-        raise ValueError(f"Unsupported format: {path.suffix}. Supported: {supported_formats}")
-    
-    print(f"Transcribing audio file: {path.name}")
-    print(f"File size: {path.stat().st_size / 1024 / 1024:.2f} MB")
-    
-    with open(path, 'rb') as audio_file:
+    path = _check_audio_file(audio_path)
+
+    logger.info("Transcribing audio file: %s", path.name)
+    logger.debug("File size: %.2f MB", path.stat().st_size / 1024 / 1024)
+
+    with path.open('rb') as audio_file:
         transcript = openai.audio.transcriptions.create(
             model="whisper-1",
             file=audio_file,
@@ -34,7 +56,79 @@ def transcribe_audio(
             prompt=prompt,
             response_format="text"
         )
-    
-    print(f"Transcription complete: {len(transcript)} characters")
-    
-    return transcript
\ No newline at end of file
+
+    logger.info("Transcription complete: %d characters", len(transcript))
+
+    return transcript
+
+
+async def _split_audio(path: Path, out_dir: Path) -> List[Path]:
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError(f"ffmpeg is required to transcribe files over {MAX_UPLOAD_BYTES // 1024 // 1024} MB")
+
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-loglevel", "error", "-i", str(path),
+        *SEGMENT_ENCODING,
+        "-f", "segment", "-segment_time", str(SEGMENT_SECONDS), "-segment_format", "mp3",
+        str(out_dir / "segment_%03d.mp3"),
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to split {path.name}: {stderr.decode(errors='replace').strip()}")
+
+    return sorted(out_dir.glob("segment_*.mp3"))
+
+
+async def _transcribe_segment(
+    client: AsyncOpenAI,
+    path: Path,
+    language: Optional[str],
+    prompt: Optional[str]
+) -> str:
+    with path.open('rb') as audio_file:
+        return await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_file,
+            language=language,
+            prompt=prompt,
+            response_format="text"
+        )
+
+
+async def transcribe_audio_async(
+    audio_path: str,
+    language: Optional[str] = None,
+    prompt: Optional[str] = None,
+    client: Optional[AsyncOpenAI] = None,
+    concurrency: int = 4
+) -> str:
+    path = _check_audio_file(audio_path)
+
+    if client is None:
+        async with AsyncOpenAI() as owned_client:
+            return await transcribe_audio_async(audio_path, language, prompt, owned_client, concurrency)
+
+    size = path.stat().st_size
+
+    logger.info("Transcribing audio file: %s", path.name)
+    logger.debug("File size: %.2f MB", size / 1024 / 1024)
+
+    if size <= MAX_UPLOAD_BYTES:
+        transcript = await _transcribe_segment(client, path, language, prompt)
+    else:
+        # Transcribe fixed-length segments concurrently and stitch them back in order
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(segment: Path) -> str:
+            async with sem:
+                return await _transcribe_segment(client, segment, language, prompt)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            segments = await _split_audio(path, Path(tmp))
+            parts = await asyncio.gather(*(one(s) for s in segments))
+        transcript = "\n".join(part.strip() for part in parts)
+
+    logger.info("Transcription complete: %d characters", len(transcript))
+
+    return transcript
@@ -0,0 +1,39 @@
+"""
+Regenerate discovery/_bundled_variants.py from the demo transcripts.
+
+Run from the repo root after editing data/interviews/*.txt:
+
+    python scripts/bundle_variants.py
+"""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = {
+    "SANITIZED": ROOT / "data" / "interviews" / "sanitized.txt",
+    "SENSITIVE": ROOT / "data" / "interviews" / "sensitive.txt",
+}
+TARGET = ROOT / "discovery" / "_bundled_variants.py"
+
+
+def render() -> str:
+    out = [
+        '"""',
+        "Demo interview transcripts bundled as constants.",
+        "",
+        "Generated by scripts/bundle_variants.py from data/interviews/*.txt - do not edit.",
+        '"""',
+        "",
+    ]
+    for name, path in SOURCES.items():
+        text = path.read_text(encoding="utf-8")
+        out.append(f"{name} = (")
+        out.extend(f"    {line!r}" for line in text.splitlines(keepends=True))
+        out.append(")")
+        out.append("")
+    return "\n".join(out)
+
+
+if __name__ == "__main__":
+    TARGET.write_text(render(), encoding="utf-8")
+    print(f"Wrote {TARGET.relative_to(ROOT)}")
@@ -0,0 +1,35 @@
+"""
+InterviewAnalyzer transcript loading.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from discovery import InterviewAnalyzer
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIG = str(ROOT / "config" / "research_guidelines.yaml")
+TRANSCRIPT = next((ROOT / "data" / "interviews").glob("*.txt"))
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return InterviewAnalyzer(CONFIG)
+
+
+def test_load_transcript_is_sync(analyzer):
+    text = analyzer.load_transcript(str(TRANSCRIPT))
+    assert text == TRANSCRIPT.read_text(encoding="utf-8")
+
+
+def test_load_transcript_async_matches_sync(analyzer):
+    text = asyncio.run(analyzer.load_transcript_async(str(TRANSCRIPT)))
+    assert text == analyzer.load_transcript(str(TRANSCRIPT))
+
+
+def test_load_transcript_missing_file(analyzer, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        analyzer.load_transcript(str(tmp_path / "missing.txt"))
@@ -0,0 +1,162 @@
+"""
+/demo/run caching, ETag and coalescing, with a stub analyzer in place of the LLM.
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+from discovery.models import InterviewInsights, PainPoint
+
+HEADERS = {"x-demo-session": "test"}
+
+
+class StubAnalyzer:
+    def __init__(self):
+        self.calls = 0
+        self.delay = 0.0
+
+    async def analyze(self, transcript, audit=True, validate=True):
+        self.calls += 1
+        run = self.calls
+        await asyncio.sleep(self.delay)
+        return InterviewInsights(pain_points=[
+            PainPoint(description=f"run{run}", impact="Two days lost", quote="It takes forever"),
+        ])
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    analyzer = StubAnalyzer()
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "analyzer", analyzer)
+    monkeypatch.setattr(api, "_ANALYZE_IS_ASYNC", True)
+    monkeypatch.setattr(api, "_CACHE", {})
+    monkeypatch.setattr(api, "VARIANT_KEY", {
+        variant: api.cache_key_for(text, "", variant) for variant, text in api.VARIANT_MAP.items()
+    })
+    return analyzer
+
+
+@pytest.fixture
+def client(stub):
+    # no context manager: the startup hook would build a real OpenAI-backed analyzer
+    return TestClient(api.app)
+
+
+def run(client, mode="auto", **headers):
+    return client.post("/demo/run", params={"mode": mode}, headers={**HEADERS, **headers})
+
+
+def description(response):
+    return orjson.loads(response.content)["insights"]["pain_points"][0]["description"]
+
+
+def test_cold_miss_runs_live_and_writes_the_cache(client, stub, tmp_path):
+    response = run(client)
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["cached"] is False
+    assert description(response) == "run1"
+    assert stub.calls == 1
+    assert (tmp_path / "sanitized.key").exists()
+    assert (tmp_path / "sanitized.response.json").exists()
+
+
+def test_memory_hit(client, stub):
+    run(client)
+    response = run(client)
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["cached"] is True
+    assert description(response) == "run1"
+    assert stub.calls == 1
+
+
+def test_file_hit_after_restart(client, stub):
+    run(client)
+    api._CACHE.clear()  # a fresh process only has the files
+    response = run(client, mode="cached")
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["cached"] is True
+    assert description(response) == "run1"
+    assert stub.calls == 1
+
+
+def test_missing_body_falls_back_to_live(client, stub, tmp_path):
+    run(client)
+    api._CACHE.clear()
+    (tmp_path / "sanitized.response.json").unlink()
+    response = run(client)
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["cached"] is False
+    assert stub.calls == 2
+
+
+def test_missing_body_after_a_file_hit_falls_back_to_live(client, stub, tmp_path):
+    run(client)
+    api._CACHE.clear()
+    run(client)  # file-backed entry now in _CACHE
+    (tmp_path / "sanitized.response.json").unlink()
+    response = run(client)
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["cached"] is False
+
+
+def test_matching_etag_gets_304(client, stub):
+    run(client)
+    etag = run(client).headers["etag"]
+    response = run(client, **{"if-none-match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_live_requests_are_coalesced(stub):
+    stub.delay = 0.05
+
+    async def burst():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await asyncio.gather(*(
+                http.post("/demo/run", params={"mode": "live"}, headers=HEADERS) for _ in range(5)
+            ))
+
+    responses = asyncio.run(burst())
+    assert [r.status_code for r in responses] == [200] * 5
+    assert {description(r) for r in responses} == {"run1"}
+    assert stub.calls == 1
+    assert api._INFLIGHT == {}
+
+
+def test_live_refresh_changes_the_etag(client, stub):
+    run(client)
+    first = run(client)
+    assert description(first) == "run1"
+
+    run(client, mode="live")  # rewrites the cache under the same transcript key
+    second = run(client)
+    assert description(second) == "run2"
+    assert second.headers["etag"] != first.headers["etag"]
+
+    response = run(client, **{"if-none-match": first.headers["etag"]})
+    assert response.status_code == 200
+    assert description(response) == "run2"
+
+
+def test_etag_survives_a_restart(client, stub):
+    run(client)
+    etag = run(client).headers["etag"]
+    api._CACHE.clear()
+    assert run(client, **{"if-none-match": etag}).status_code == 304
+
+
+def test_old_sidecar_without_etag_is_a_miss(client, stub, tmp_path):
+    run(client)
+    api._CACHE.clear()
+    (tmp_path / "sanitized.key").write_bytes(api.VARIANT_KEY["sanitized"].encode("ascii"))
+    response = run(client)
+    assert orjson.loads(response.content)["cached"] is False
+    assert stub.calls == 2
@@ -0,0 +1,30 @@
+"""
+The bundled demo transcripts must stay in sync with data/interviews/*.txt.
+"""
+
+import importlib.util
+from pathlib import Path
+
+from discovery import _bundled_variants
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_bundler():
+    spec = importlib.util.spec_from_file_location("bundle_variants", ROOT / "scripts" / "bundle_variants.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_bundled_module_is_up_to_date():
+    bundler = _load_bundler()
+    assert bundler.TARGET.read_text(encoding="utf-8") == bundler.render(), (
+        "discovery/_bundled_variants.py is stale; run python scripts/bundle_variants.py"
+    )
+
+
+def test_bundled_constants_match_sources():
+    bundler = _load_bundler()
+    for name, path in bundler.SOURCES.items():
+        assert getattr(_bundled_variants, name) == path.read_text(encoding="utf-8")
@@ -0,0 +1,214 @@
+"""
+Regression tests for PII redaction, audit and output validation.
+"""
+
+import copy
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from discovery import privacy
+from discovery.config import load_guidelines
+from discovery.models import InterviewInsights, PainPoint
+from discovery.privacy import (
+    PrivacyEngine,
+    audit_pii_in_transcript,
+    enforce_pii_removal,
+    validate_no_pii,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+RULES = load_guidelines(str(ROOT / "config" / "research_guidelines.yaml"))['privacy_enforcement']
+
+
+def legacy_enforce_pii_removal(text, privacy_rules):
+    # The original six sequential passes. The engine agrees with them on realistic
+    # text but not everywhere; see test_leftmost_match_differs_from_sequential_passes.
+    patterns = privacy_rules['pii_removal']['patterns']
+    replacements = privacy_rules['pii_removal']['replacement_tokens']
+    text = re.sub(patterns['api_token'], replacements['api_token'], text)
+    text = re.sub(patterns['iban'], replacements['iban'], text)
+    text = re.sub(patterns['email'], replacements['email'], text, flags=re.IGNORECASE)
+    text = re.sub(patterns['phone'], replacements['phone'], text)
+    text = re.sub(patterns['employee_id'], replacements['employee_id'], text, flags=re.IGNORECASE)
+    text = re.sub(patterns['names'], replacements['names'], text)
+    return text
+
+
+SAMPLES = [
+    "Kontakt Anna@firma.de",
+    "Kollege Emp12345",
+    "Siehe Anna.b@firma.de und user_12345",
+    "Ruf an: +49 170 1234 5678 oder 030-1234-5678",
+    "IBAN DE89 3704 0044 0532 0130 00 bitte",
+    "token sk_live_AbC123xyz in the logs",
+    "Frau Jürgens schrieb an jürgen.schmidt@example.com wegen EMP-00042",
+    "Max\xa0Müller",
+    "Ruf an: +49 \u0661\u0667\u0660 \u0661\u0662\u0663\u0664\u0665\u0666\u0667",
+    "Fax \uff10\uff13\uff10\u3000\uff11\uff12\uff13\uff14\uff15\uff16\uff17",
+    "nothing to see here, all lowercase",
+    "",
+]
+
+DEMO_FILES = sorted((ROOT / "data" / "interviews").glob("*.txt"))
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return PrivacyEngine(RULES)
+
+
+def leftmost_match_reference(text, privacy_rules):
+    # Specification of PrivacyEngine.clean, written as an explicit scan: at each position
+    # the first structured pattern (in STRUCTURED_ORDER) that matches there wins.
+    patterns = privacy_rules['pii_removal']['patterns']
+    replacements = privacy_rules['pii_removal']['replacement_tokens']
+    compiled = [
+        (re.compile(patterns[name], re.IGNORECASE if name in privacy.CASE_INSENSITIVE else 0), replacements[name])
+        for name in privacy.STRUCTURED_ORDER
+    ]
+    out, pos = [], 0
+    while pos < len(text):
+        for pattern, token in compiled:
+            match = pattern.match(text, pos)
+            if match:
+                out.append(token)
+                pos = match.end()
+                break
+        else:
+            out.append(text[pos])
+            pos += 1
+    return re.sub(patterns['names'], replacements['names'], "".join(out))
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_redaction_matches_sequential_passes_on_samples(engine, text):
+    assert engine.clean(text) == legacy_enforce_pii_removal(text, RULES)
+
+
+@pytest.mark.parametrize("path", DEMO_FILES, ids=lambda p: p.name)
+def test_redaction_matches_sequential_passes_on_demo_transcripts(engine, path):
+    text = path.read_text(encoding="utf-8")
+    assert engine.clean(text) == legacy_enforce_pii_removal(text, RULES)
+
+
+# Where structured matches overlap, the leftmost one wins and the text it consumed is
+# not rescanned; the old sequential passes let a later pattern redact a fragment first.
+LEFTMOST_CASES = [
+    ("EMP-1234567", "EMP-[PHONE]", "[ID]"),
+    ("x_sk_live_abc@x.com", "x_[API_KEY]@x.com", "[EMAIL]"),
+    ("3Ä50@DE89.desk_live_2", "3Ä[EMAIL][API_KEY]", "3Ä[EMAIL]_live_2"),
+    ("EMP4674435\xa089a4", "EMP[PHONE]a4", "[ID]\xa089a4"),
+    ("emp1234567, max+4917012345678@firma.de", "emp[PHONE], [EMAIL]", "[ID], [EMAIL]"),
+]
+
+
+@pytest.mark.parametrize("text, sequential, leftmost", LEFTMOST_CASES)
+def test_leftmost_match_differs_from_sequential_passes(engine, text, sequential, leftmost):
+    assert legacy_enforce_pii_removal(text, RULES) == sequential
+    assert leftmost_match_reference(text, RULES) == leftmost
+    assert engine.clean(text) == leftmost
+
+
+FUZZ_PIECES = [
+    "EMP", "emp", "user", "-", "_", "sk_live_", "pk_test_", "abc", "DE89", "0", "12", "345",
+    "4917012345678", " ", "\xa0", "+", "@", ".", "x.com", "Ä", "Max", "Müller", "de", "\n",
+]
+
+
+def test_clean_matches_leftmost_reference_on_fuzzed_text(engine, stdlib_engine):
+    rng = random.Random(0)
+    for _ in range(3000):
+        text = "".join(rng.choices(FUZZ_PIECES, k=rng.randint(1, 12)))
+        expected = leftmost_match_reference(text, RULES)
+        assert engine.clean(text) == expected, text
+        assert stdlib_engine.clean(text) == expected, text
+
+
+def test_names_do_not_swallow_structured_matches(engine):
+    assert engine.clean("Kontakt Anna@firma.de") == "[NAME] [EMAIL]"
+    assert engine.clean("Kollege Emp12345") == "[NAME] [ID]"
+
+
+def test_module_functions_accept_raw_rules():
+    text = "Kontakt Anna@firma.de"
+    assert enforce_pii_removal(text, RULES) == legacy_enforce_pii_removal(text, RULES)
+
+
+def test_disabled_rules_leave_text_untouched():
+    rules = copy.deepcopy(RULES)
+    rules['pii_removal']['enabled'] = False
+    text = "Kontakt Anna@firma.de"
+    assert enforce_pii_removal(text, rules) is text
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_clean_audit_means_cleanup_is_a_no_op(engine, text):
+    # InterviewAnalyzer.analyze skips cleanup when every audit count is zero
+    findings = audit_pii_in_transcript(text, engine)
+    if not any(findings.values()):
+        assert engine.clean(text) == text
+
+
+def test_audit_counts_what_clean_redacts(engine):
+    # Categories are exclusive: each span counts under the pattern that redacts it
+    findings = audit_pii_in_transcript("emp1234567, max+4917012345678@firma.de", engine)
+    assert findings['Employee IDs'] == 1
+    assert findings['Emails'] == 1
+    assert findings['Phone Numbers'] == 0
+
+
+def test_audit_counts(engine):
+    findings = audit_pii_in_transcript("Kontakt Anna@firma.de, Tel +49 170 1234567", engine)
+    assert findings['Emails'] == 1
+    assert findings['Phone Numbers'] == 1
+    assert findings['Employee IDs'] == 0
+    assert findings['Names'] == 2  # "Kontakt Anna", "Tel"
+
+
+def test_validation_blocks_pii_in_any_field(engine):
+    insights = InterviewInsights(pain_points=[
+        PainPoint(description="Onboarding is slow", impact="Mail anna@firma.de", quote="fine"),
+    ])
+    with pytest.raises(ValueError):
+        validate_no_pii(insights, engine)
+
+
+def test_validation_passes_clean_output(engine):
+    insights = InterviewInsights(pain_points=[
+        PainPoint(description="Onboarding is slow", impact="Two days lost", quote="It takes forever"),
+    ])
+    assert validate_no_pii(insights, engine) is True
+
+
+@pytest.fixture
+def stdlib_engine(monkeypatch):
+    monkeypatch.setattr(privacy, "re2", None)
+    return PrivacyEngine(RULES)
+
+
+def test_re2_is_used_when_installed(engine):
+    pytest.importorskip("re2")
+    assert not isinstance(engine._structured, re.Pattern)
+    assert not isinstance(engine._names, re.Pattern)
+
+
+@pytest.mark.parametrize("text", SAMPLES + [p.read_text(encoding="utf-8") for p in DEMO_FILES])
+def test_re2_matches_stdlib_re(engine, stdlib_engine, text):
+    pytest.importorskip("re2")
+    assert engine.clean(text) == stdlib_engine.clean(text)
+    assert engine.count(text) == stdlib_engine.count(text)
+    assert engine.find_issues([text]) == stdlib_engine.find_issues([text])
+
+
+def test_unicode_whitespace_and_digits(engine):
+    assert engine.clean("Max\xa0Müller") == "[NAME]"
+    assert engine.count("Max\xa0Müller")['Names'] == 1
+    assert engine.clean("Tel +49 \u0661\u0667\u0660 \u0661\u0662\u0663\u0664\u0665\u0666\u0667") == "[NAME] [PHONE]"
+
+
+@pytest.mark.parametrize("pattern", [r"\w+", r"\bfoo", r"foo$", r"[\S]"])
+def test_patterns_with_diverging_semantics_stay_on_re(pattern):
+    assert privacy._re2_pattern(pattern) is None
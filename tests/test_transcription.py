@@ -0,0 +1,96 @@
+"""
+Split-and-gather transcription of uploads over Whisper's size limit.
+"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from discovery import transcription
+
+
+class FakeProcess:
+    def __init__(self, returncode: int, stderr: bytes = b""):
+        self.returncode = returncode
+        self._stderr = stderr
+
+    async def communicate(self):
+        return b"", self._stderr
+
+
+def fake_ffmpeg(segments: int, calls: list, returncode: int = 0, stderr: bytes = b""):
+    async def create_subprocess_exec(*args, **kwargs):
+        calls.append(args)
+        pattern = Path(args[-1])
+        # written out of order; the caller must sort them
+        for index in reversed(range(segments)):
+            (pattern.parent / (pattern.name % index)).write_bytes(b"mp3")
+        return FakeProcess(returncode, stderr)
+    return create_subprocess_exec
+
+
+class FakeClient:
+    def __init__(self):
+        self.files = []
+        self.audio = SimpleNamespace(transcriptions=SimpleNamespace(create=self.create))
+
+    async def create(self, *, model, file, language, prompt, response_format):
+        name = Path(file.name).name
+        self.files.append(name)
+        index = int(name.removeprefix("segment_").removesuffix(".mp3"))
+        # later segments finish first, so gather order is what keeps the text in order
+        await asyncio.sleep(0.01 * (5 - index))
+        return f"  part {index}\n"
+
+
+@pytest.fixture
+def big_audio(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcription, "MAX_UPLOAD_BYTES", 4)
+    monkeypatch.setattr(transcription.shutil, "which", lambda name: f"/usr/bin/{name}")
+    path = tmp_path / "interview.wav"
+    path.write_bytes(b"RIFF" * 16)
+    return path
+
+
+def test_segments_are_transcribed_and_joined_in_order(big_audio, monkeypatch):
+    calls = []
+    monkeypatch.setattr(transcription.asyncio, "create_subprocess_exec", fake_ffmpeg(5, calls))
+    client = FakeClient()
+
+    transcript = asyncio.run(transcription.transcribe_audio_async(str(big_audio), client=client, concurrency=2))
+
+    assert transcript == "part 0\npart 1\npart 2\npart 3\npart 4"
+    assert sorted(client.files) == [f"segment_{i:03d}.mp3" for i in range(5)]
+    args = calls[0]
+    assert args[0] == "ffmpeg"
+    assert args[args.index("-segment_format") + 1] == "mp3"
+    assert "-c" not in args  # re-encoded, never stream-copied
+
+
+def test_small_files_are_sent_whole(tmp_path, monkeypatch):
+    path = tmp_path / "short.mp3"
+    path.write_bytes(b"mp3")
+    monkeypatch.setattr(transcription.asyncio, "create_subprocess_exec", None)  # must not split
+
+    async def create(*, file, **kwargs):
+        return Path(file.name).name
+
+    client = SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create)))
+    assert asyncio.run(transcription.transcribe_audio_async(str(path), client=client)) == "short.mp3"
+
+
+def test_ffmpeg_failure_is_reported(big_audio, monkeypatch):
+    monkeypatch.setattr(
+        transcription.asyncio, "create_subprocess_exec",
+        fake_ffmpeg(0, [], returncode=1, stderr=b"Invalid data found when processing input\n"),
+    )
+    with pytest.raises(RuntimeError, match="ffmpeg failed to split interview.wav: Invalid data found"):
+        asyncio.run(transcription.transcribe_audio_async(str(big_audio), client=FakeClient()))
+
+
+def test_missing_ffmpeg_is_reported(big_audio, monkeypatch):
+    monkeypatch.setattr(transcription.shutil, "which", lambda name: None)
+    with pytest.raises(RuntimeError, match="ffmpeg is required"):
+        asyncio.run(transcription.transcribe_audio_async(str(big_audio), client=FakeClient()))